@@ -19,6 +19,7 @@ class Config:
     # Server configuration
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     MAX_TIMEOUT: int = int(os.getenv("MAX_TIMEOUT", "300"))
+    MAX_CONCURRENT_SCANS: int = int(os.getenv("MAX_CONCURRENT_SCANS", "2"))
     
     # Optional WPScan API token
     WPSCAN_API_TOKEN: str = os.getenv("WPSCAN_API_TOKEN", "")
@@ -31,6 +32,9 @@ class Config:
         
         if cls.MAX_TIMEOUT < 30:
             raise ValueError("MAX_TIMEOUT must be at least 30 seconds")
+        
+        if cls.MAX_CONCURRENT_SCANS < 1:
+            raise ValueError("MAX_CONCURRENT_SCANS must be at least 1")
 
 
 # Validate config on import
@@ -1,8 +1,14 @@
 """Tests for nmap_scan tool."""
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from src.server import call_tool, sanitize_target, check_network_permission
+from src.server import (
+    call_tool, sanitize_target, check_network_permission, run_docker_command,
+    list_tools, TOOL_HANDLERS,
+)
 
 
 class TestSanitizeTarget:
@@ -196,6 +202,109 @@ class TestSearchsploit:
         assert len(result) == 1
 
 
+@pytest.mark.asyncio
+class TestListTools:
+    """Test tool listing."""
+    
+    async def test_every_tool_has_handler(self):
+        """Should list exactly the tools that call_tool can dispatch."""
+        tools = await list_tools()
+        
+        assert {tool.name for tool in tools} == set(TOOL_HANDLERS)
+        assert await list_tools() is tools
+
+
+@pytest.mark.asyncio
+class TestRunDockerCommand:
+    """Test Docker command execution."""
+    
+    @patch('src.server.docker_client')
+    async def test_runs_container_off_event_loop(self, mock_client):
+        """Should run the container in a worker thread and collect its logs."""
+        threads = {}
+        
+        def record(step, value=None):
+            def side_effect(*args, **kwargs):
+                threads[step] = threading.current_thread()
+                return value
+            return side_effect
+        
+        container = MagicMock()
+        container.wait.side_effect = record("wait", {"StatusCode": 0})
+        container.logs.return_value = b"scan output"
+        container.remove.side_effect = record("remove")
+        mock_client.containers.run.side_effect = record("run", container)
+        
+        result = await run_docker_command(["nmap", "127.0.0.1"], timeout=60)
+        
+        assert result == {"stdout": "scan output", "stderr": "", "exit_code": 0}
+        assert set(threads) == {"run", "wait", "remove"}
+        for thread in threads.values():
+            assert thread is not threading.main_thread()
+        container.wait.assert_called_once_with(timeout=60)
+        container.remove.assert_called_once_with(force=True)
+
+    
+    @patch('src.server.docker_client')
+    async def test_removes_container_when_cancelled(self, mock_client):
+        """Should remove the container when the tool call is cancelled mid-scan."""
+        wait_started = threading.Event()
+        release_wait = threading.Event()
+        
+        def wait(timeout):
+            wait_started.set()
+            release_wait.wait(5)
+            return {"StatusCode": 0}
+        
+        container = MagicMock()
+        container.wait.side_effect = wait
+        mock_client.containers.run.return_value = container
+        
+        task = asyncio.create_task(run_docker_command(["nmap", "127.0.0.1"], timeout=60))
+        await asyncio.to_thread(wait_started.wait, 5)
+        task.cancel()
+        
+        try:
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        finally:
+            release_wait.set()
+        
+        container.remove.assert_called_once_with(force=True)
+        container.logs.assert_not_called()
+
+    
+    @patch('src.server.scan_slots', new_callable=lambda: asyncio.Semaphore(1))
+    @patch('src.server.docker_client')
+    async def test_limits_concurrent_containers(self, mock_client, mock_slots):
+        """Should not start more containers than there are scan slots."""
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        
+        def wait(timeout):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            threading.Event().wait(0.05)
+            with lock:
+                running -= 1
+            return {"StatusCode": 0}
+        
+        container = MagicMock()
+        container.wait.side_effect = wait
+        container.logs.return_value = b""
+        mock_client.containers.run.return_value = container
+        
+        await asyncio.gather(*[
+            run_docker_command(["nmap", "127.0.0.1"], timeout=60) for _ in range(3)
+        ])
+        
+        assert peak == 1
+        assert container.remove.call_count == 3
+
+
 @pytest.mark.asyncio
 class TestErrorHandling:
     """Test error handling."""